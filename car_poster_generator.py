@@ -4,136 +4,333 @@ Car Poster Generator
 Fetches car specifications from automobile-catalog.com and generates a poster image.
 """
 
+import pygtrie
 import requests
+from rapidfuzz import fuzz, process
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+from bs4.dammit import EncodingDetector
+import lxml.html
+from lxml import etree
 import re
-from PIL import Image, ImageDraw, ImageFont
+import sys
 import os
-from typing import Dict, List, Optional
+import atexit
+import codecs
+import functools
+import gzip
+import hashlib
+import io
+import json
+import logging
+import queue
+import threading
+import types
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Dict, List, Mapping, Optional, Tuple, Union
 import time
-from urllib.parse import urljoin, quote
+from urllib.parse import urljoin, urlparse, quote
 
+if TYPE_CHECKING:
+    from PIL import Image
 
-def _fetch_with_selenium(url: str, timeout: int = 30, verbose: bool = False) -> Optional[str]:
-    """Fetch page HTML using Selenium. Tries undetected-chromedriver first, then regular Chrome with anti-detection options."""
-    driver = None
 
-    def _get_driver_uc():
-        """Try undetected-chromedriver (best at bypassing Cloudflare)."""
+log = logging.getLogger(__name__)
+
+
+def _create_driver_uc(timeout: int):
+    """Try undetected-chromedriver (best at bypassing Cloudflare)."""
+    try:
+        import undetected_chromedriver as uc
+        opts = uc.ChromeOptions()
+        opts.add_argument("--no-sandbox")
+        opts.add_argument("--disable-dev-shm-usage")
+        opts.add_argument("--window-size=1920,1080")
+        # Match Chrome version: env CHROME_MAJOR_VERSION=144 if driver/browser versions mismatch
+        version_main = None
         try:
-            import undetected_chromedriver as uc
-            opts = uc.ChromeOptions()
-            opts.add_argument("--no-sandbox")
-            opts.add_argument("--disable-dev-shm-usage")
-            opts.add_argument("--window-size=1920,1080")
-            # Match Chrome version: env CHROME_MAJOR_VERSION=144 if driver/browser versions mismatch
-            version_main = None
+            v = os.environ.get("CHROME_MAJOR_VERSION", "").strip()
+            if v and v.isdigit():
+                version_main = int(v)
+        except Exception:
+            pass
+        err_msg = ""
+        for attempt in range(2):
             try:
-                v = os.environ.get("CHROME_MAJOR_VERSION", "").strip()
-                if v and v.isdigit():
-                    version_main = int(v)
-            except Exception:
-                pass
-            err_msg = ""
-            for attempt in range(2):
-                try:
-                    if version_main is not None:
-                        driver = uc.Chrome(options=opts, version_main=version_main)
-                    else:
-                        driver = uc.Chrome(options=opts)
-                    driver.set_page_load_timeout(timeout)
+                if version_main is not None:
+                    driver = uc.Chrome(options=opts, version_main=version_main)
+                else:
+                    driver = uc.Chrome(options=opts)
+                driver.set_page_load_timeout(timeout)
+                return driver
+            except Exception as e:
+                err_msg = str(e)
+                # ChromeDriver version mismatch: "Current browser version is 144.x" -> use 144
+                match = re.search(r"Current browser version is (\d+)", err_msg, re.I)
+                if match and version_main is None:
+                    version_main = int(match.group(1))
+                    log.debug("  Using ChromeDriver for version %s to match your browser.", version_main)
+                    continue
+                break
+        if err_msg:
+            log.debug("  undetected_chromedriver failed: %s", err_msg)
+            if "distutils" in err_msg.lower():
+                log.debug("  Fix (Python 3.12+): pip install setuptools")
+            if "version" in err_msg.lower() and "chrome" in err_msg.lower():
+                log.debug("  Fix: set CHROME_MAJOR_VERSION=144  (match your Chrome major version)")
+        return None
+    except Exception as e:
+        log.debug("  undetected_chromedriver not available or failed: %s", e)
+        if "distutils" in str(e).lower():
+            log.debug("  Fix (Python 3.12+): pip install setuptools")
+        return None
+
+
+def _create_driver_plain(timeout: int):
+    """Fallback: standard Selenium with anti-detection options."""
+    try:
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        options = Options()
+        options.add_argument("--headless=new")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--disable-blink-features=AutomationControlled")
+        options.add_argument("--window-size=1920,1080")
+        options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+        options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        options.add_experimental_option("useAutomationExtension", False)
+        driver = webdriver.Chrome(options=options)
+        driver.set_page_load_timeout(timeout)
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
+            "source": "Object.defineProperty(navigator, 'webdriver', { get: () => undefined });"
+        })
+        return driver
+    except Exception as e:
+        log.debug("  Selenium Chrome failed: %s", e)
+        return None
+
+
+class _DriverPool:
+    """Keeps Chrome drivers alive between fetches so browser startup is paid once per process."""
+
+    def __init__(self, size: int = 1):
+        self.size = max(1, size)
+        self._idle: "queue.Queue" = queue.Queue()
+        self._drivers = []
+        self._starting = 0
+        self._lock = threading.Lock()
+
+    def _create(self, timeout: int):
+        driver = _create_driver_uc(timeout)
+        if driver is None:
+            driver = _create_driver_plain(timeout)
+        return driver
+
+    def acquire(self, timeout: int = 30):
+        """Return a warm driver, starting a new one only if the pool isn't full yet. None if Chrome can't start."""
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                with self._lock:
+                    can_create = len(self._drivers) + self._starting < self.size
+                    if can_create:
+                        self._starting += 1
+                if can_create:
+                    driver = None
+                    try:
+                        driver = self._create(timeout)
+                    finally:
+                        with self._lock:
+                            self._starting -= 1
+                            if driver is not None:
+                                self._drivers.append(driver)
                     return driver
-                except Exception as e:
-                    err_msg = str(e)
-                    # ChromeDriver version mismatch: "Current browser version is 144.x" -> use 144
-                    match = re.search(r"Current browser version is (\d+)", err_msg, re.I)
-                    if match and version_main is None:
-                        version_main = int(match.group(1))
-                        if verbose:
-                            print(f"  Using ChromeDriver for version {version_main} to match your browser.")
-                        continue
-                    break
-            if verbose and err_msg:
-                print(f"  undetected_chromedriver failed: {err_msg}")
-                if "distutils" in err_msg.lower():
-                    print("  Fix (Python 3.12+): pip install setuptools")
-                if "version" in err_msg.lower() and "chrome" in err_msg.lower():
-                    print("  Fix: set CHROME_MAJOR_VERSION=144  (match your Chrome major version)")
-            return None
-        except Exception as e:
-            if verbose:
-                print(f"  undetected_chromedriver not available or failed: {e}")
-                if "distutils" in str(e).lower():
-                    print("  Fix (Python 3.12+): pip install setuptools")
-            return None
+                # Pool is full: wait for a driver to be released (or discarded, freeing a slot)
+                try:
+                    driver = self._idle.get(timeout=1)
+                except queue.Empty:
+                    continue
+            # An idle driver whose Chrome has died is dropped, and the loop starts or waits for another
+            try:
+                driver.set_page_load_timeout(timeout)
+            except Exception:
+                self.discard(driver)
+                continue
+            return driver
+
+    def release(self, driver):
+        self._idle.put(driver)
 
-    def _get_driver_plain():
-        """Fallback: standard Selenium with anti-detection options."""
+    def discard(self, driver):
+        """Quit a driver that is in a bad state instead of returning it to the pool."""
+        with self._lock:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
         try:
-            from selenium import webdriver
-            from selenium.webdriver.chrome.options import Options
-            options = Options()
-            options.add_argument("--headless=new")
-            options.add_argument("--disable-gpu")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--disable-blink-features=AutomationControlled")
-            options.add_argument("--window-size=1920,1080")
-            options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-            options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            options.add_experimental_option("useAutomationExtension", False)
-            driver = webdriver.Chrome(options=options)
-            driver.set_page_load_timeout(timeout)
-            driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
-                "source": "Object.defineProperty(navigator, 'webdriver', { get: () => undefined });"
-            })
-            return driver
-        except Exception as e:
-            if verbose:
-                print(f"  Selenium Chrome failed: {e}")
-            return None
+            driver.quit()
+        except Exception:
+            pass
+
+    def close_all(self):
+        with self._lock:
+            drivers, self._drivers = self._drivers, []
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+
+def _pool_size_from_env() -> int:
+    v = os.environ.get("CAR_POSTER_DRIVER_POOL", "").strip()
+    return int(v) if v.isdigit() else 1
+
+
+_DRIVER_POOL = _DriverPool(_pool_size_from_env())
+atexit.register(_DRIVER_POOL.close_all)
+
 
+def _fetch_with_selenium(url: str, timeout: int = 30) -> Optional[str]:
+    """Fetch page HTML using a pooled Selenium driver (undetected-chromedriver first, then regular Chrome).
+
+    The driver is kept open afterwards, so later fetches skip browser startup and reuse the Cloudflare clearance cookie.
+    """
+    driver = _DRIVER_POOL.acquire(timeout)
+    if driver is None:
+        log.debug("  Install: pip install undetected-chromedriver  (recommended for Cloudflare sites)")
+        return None
+
+    healthy = True
     try:
-        driver = _get_driver_uc()
-        if driver is None:
-            driver = _get_driver_plain()
-        if driver is None:
-            if verbose:
-                print("  Install: pip install undetected-chromedriver  (recommended for Cloudflare sites)")
-            return None
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        def on_challenge(d) -> bool:
+            title = d.title
+            return "Just a moment" in title or "Checking your browser" in title
 
         driver.get(url)
-        # Wait for Cloudflare or real content
-        for _ in range(18):
+        if log.isEnabledFor(logging.DEBUG) and on_challenge(driver):
+            log.debug("  Waiting for Cloudflare check...")
+        # Wait for Cloudflare to clear and real content to render (NoSuchElement is retried by WebDriverWait)
+        try:
+            WebDriverWait(driver, 18).until(
+                lambda d: not on_challenge(d) and len(d.find_element(By.TAG_NAME, "body").text) > 500
+            )
+            # Allow a bit more for dynamic content
             time.sleep(1)
-            html = driver.page_source
-            if "Just a moment" in html or "Checking your browser" in html:
-                if verbose and _ == 0:
-                    print("  Waiting for Cloudflare check...")
-                continue
-            # Page likely loaded (no challenge), allow a bit more for dynamic content
-            if len(html) > 5000:
-                time.sleep(2)
-                html = driver.page_source
-                if "Just a moment" not in html and "Checking your browser" not in html:
-                    return html
-        # Timeout or still on challenge page
-        html = driver.page_source if driver else ""
+        except TimeoutException:
+            pass
+        html = driver.page_source
         if "Just a moment" in html or "Checking your browser" in html:
-            if verbose:
-                print("  Site still showing Cloudflare check. Try: pip install undetected-chromedriver")
+            log.debug("  Site still showing Cloudflare check. Try: pip install undetected-chromedriver")
             return None
         return html
     except Exception as e:
-        if verbose:
-            print(f"  Browser fetch error: {e}")
+        healthy = False
+        log.debug("  Browser fetch error: %s", e)
         return None
     finally:
-        if driver:
-            try:
-                driver.quit()
-            except Exception:
-                pass
+        if healthy:
+            _DRIVER_POOL.release(driver)
+        else:
+            _DRIVER_POOL.discard(driver)
+
+
+# On-disk cache for fetched pages and car images (HTTP responses in SQLite, browser-rendered HTML as gzip files)
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "car_poster")
+CACHE_EXPIRE_SECONDS = 86400
+
+
+def _browser_cache_path(url: str) -> str:
+    return os.path.join(CACHE_DIR, hashlib.sha1(url.encode("utf-8")).hexdigest() + ".html.gz")
+
+
+def _read_browser_cache(url: str) -> Optional[str]:
+    path = _browser_cache_path(url)
+    try:
+        if time.time() - os.path.getmtime(path) > CACHE_EXPIRE_SECONDS:
+            return None
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _write_browser_cache(url: str, html: str):
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with gzip.open(_browser_cache_path(url), "wt", encoding="utf-8", compresslevel=1) as f:
+            f.write(html)
+    except OSError:
+        pass
+
+
+# Keys a parsed specs dict may hold, interned so dicts rebuilt from the JSON cache share the key objects
+# (and hash/compare by identity) with the literals used by the parser and the poster layout
+_SPEC_KEYS = tuple(map(sys.intern, (
+    'year', 'engine', 'power', 'torque', 'weight', 'acceleration_0_100', 'top_speed', 'image_url', '_url',
+)))
+
+
+# Parsed specs per URL, stored with the page's ETag/Last-Modified so an unchanged page isn't parsed again
+def _specs_cache_path(url: str) -> str:
+    return os.path.join(CACHE_DIR, hashlib.sha1(url.encode("utf-8")).hexdigest() + ".specs.json")
+
+
+def _response_validator(response: requests.Response) -> Optional[str]:
+    return response.headers.get("ETag") or response.headers.get("Last-Modified")
+
+
+def _read_specs_cache(url: str, validator: str) -> Optional[Dict]:
+    try:
+        with open(_specs_cache_path(url), encoding="utf-8") as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    specs = entry.get("specs") if entry.get("validator") == validator else None
+    if not isinstance(specs, dict):
+        return None
+    return {key: specs[key] for key in _SPEC_KEYS if key in specs} or None
+
+
+def _write_specs_cache(url: str, validator: str, specs: Dict):
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(_specs_cache_path(url), "w", encoding="utf-8") as f:
+            json.dump({"validator": validator, "specs": specs}, f, ensure_ascii=False)
+    except OSError:
+        pass
+
+
+# URLs that recently yielded no specs are marked with an empty file and skipped for this long
+MISS_EXPIRE_SECONDS = 3600
+
+
+def _miss_marker_path(url: str) -> str:
+    return os.path.join(CACHE_DIR, hashlib.sha1(url.encode("utf-8")).hexdigest() + ".miss")
+
+
+def _is_recent_miss(url: str) -> bool:
+    try:
+        return time.time() - os.path.getmtime(_miss_marker_path(url)) <= MISS_EXPIRE_SECONDS
+    except OSError:
+        return False
+
+
+def _record_miss(url: str):
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(_miss_marker_path(url), "w"):
+            pass
+    except OSError:
+        pass
 
 
 # Car brand -> country of production (ISO 3166-1 alpha-2)
@@ -187,6 +384,120 @@ KNOWN_MODEL_URLS = {
         ("Audi TT RS", "https://www.automobile-catalog.com/model/audi/tt_rs.html"),
     ],
 }
+# Entries may be written in any case; normalize (and intern) the keys once so lookups are plain hashing
+KNOWN_MODEL_URLS = {
+    (sys.intern(b.strip().lower()), sys.intern(m.strip().lower())): entries
+    for (b, m), entries in KNOWN_MODEL_URLS.items()
+}
+
+
+def _group_by_brand(known: Mapping[Tuple[str, str], List[Tuple[str, str]]]) -> Dict[str, Dict[str, List[Tuple[str, str]]]]:
+    by_brand: Dict[str, Dict[str, List[Tuple[str, str]]]] = {}
+    for (brand, model), entries in known.items():
+        by_brand.setdefault(brand, {})[model] = entries
+    return by_brand
+
+
+# KNOWN_MODEL_URLS regrouped as brand -> model -> entries, so a lookup only touches one brand's models
+_BY_BRAND = _group_by_brand(KNOWN_MODEL_URLS)
+
+# Model names and slugs split into word tokens ("tt rs", "tt_rs" and "tt-rs" all give {"tt", "rs"})
+_TOKEN_SPLIT_RE = re.compile(r'[_\s-]+')
+_SLUG_TOKENS: Dict[str, Dict[str, frozenset]] = {
+    b: {m: frozenset(filter(None, _TOKEN_SPLIT_RE.split(m))) for m in models} for b, models in _BY_BRAND.items()
+}
+
+# Per-brand tries over the same model keys, built on first prefix lookup
+_BRAND_TRIES: Dict[str, pygtrie.CharTrie] = {}
+
+
+def _find_known_urls(brand_key: str, model_key: str) -> List[Tuple[str, str]]:
+    """KNOWN_MODEL_URLS (name, url) entries for a brand/model: exact, prefix, token overlap, then fuzzy; [] if none."""
+    brand_models = _BY_BRAND.get(brand_key)
+    if not brand_models:
+        return []
+    entries = brand_models.get(model_key)
+    if entries:
+        return entries
+    trie = _BRAND_TRIES.get(brand_key)
+    if trie is None:
+        trie = _BRAND_TRIES[brand_key] = pygtrie.CharTrie(brand_models)
+    step = trie.longest_prefix(model_key)
+    if step:
+        return step.value
+    if trie.has_subtrie(model_key):
+        return next(trie.itervalues(prefix=model_key))
+    query_tokens = frozenset(filter(None, _TOKEN_SPLIT_RE.split(model_key)))
+    if query_tokens:
+        best, best_score = None, 0.0
+        for m, tokens in _SLUG_TOKENS[brand_key].items():
+            shared = query_tokens & tokens
+            # One common token ("rs") says little; need two, and all of the key's or half of the larger set
+            if len(shared) < 2:
+                continue
+            score = len(shared) / max(len(query_tokens), len(tokens))
+            if (shared == tokens or score >= 0.5) and score > best_score:
+                best, best_score = m, score
+        if best is not None:
+            return brand_models[best]
+    # Plain ratio, not WRatio: its partial matching let short slugs like "rs6" score 72 against "tt rs"
+    entries = []
+    for m, _score, _ in process.extract(model_key, brand_models.keys(), scorer=fuzz.ratio, limit=3,
+                                        score_cutoff=80):
+        entries.extend(e for e in brand_models[m] if e not in entries)
+    return entries
+
+
+# Fallback patterns run over the page text when a spec is missing from the tables
+_ENGINE_RE = re.compile(r'(\d+\.?\d*)\s*L(?:\s*TFSI|\s*TDI|\s*V6|\s*V8|\s*I4)?', re.I)
+_POWER_RE = re.compile(r'(\d+)\s*(?:HP|hp|PS|ps|kW|kw)', re.I)
+_TORQUE_RE = re.compile(r'(\d+)\s*Nm|(\d+)\s*lb-ft|(\d+)\s*lb\.ft', re.I)
+_WEIGHT_RE = re.compile(r'(\d{3,5})\s*kg|(\d{3,5})\s*lbs?', re.I)
+_ACCEL_RE = re.compile(r'0-100[^\d]*(\d+\.?\d*)\s*s(?:ec)?|0-60[^\d]*(\d+\.?\d*)\s*s(?:ec)?', re.I)
+_TOP_SPEED_RE = re.compile(r'(?:top|max(?:imum)?)\s*speed[^\d]*(\d+)\s*km/h|(\d+)\s*km/h.*top', re.I)
+_YEAR_RE = re.compile(r'(\d{4})\s*-\s*(\d{4})|(\d{4})')
+_YEAR_VALUE_RE = re.compile(r"^[\d\s\-]+$")
+_MODEL_PATH_RE = re.compile(r'/(?:model|car|make)/')
+_CHARSET_RE = re.compile(r'charset="?([\w.:-]+)', re.I)
+# Model slugs on the site use underscores for both spaces and hyphens
+_SLUG_TABLE = str.maketrans({' ': '_', '-': '_'})
+
+
+def _html_parser_for(encoding: Optional[str]) -> Optional[lxml.html.HTMLParser]:
+    """lxml HTML parser decoding with encoding, or None if it's missing or unknown (e.g. "utf8mb4" or a typo)."""
+    if not encoding:
+        return None
+    try:
+        # Python's canonical name also covers aliases lxml doesn't know ("u8", "koi8_r")
+        return lxml.html.HTMLParser(encoding=codecs.lookup(encoding).name)
+    except LookupError:
+        return None
+
+
+def _text_strings(root):
+    """Text nodes under root in document order, skipping comments and script/style contents (like bs4's get_text)."""
+    for event, node in etree.iterwalk(root, events=("start", "end", "comment", "pi")):
+        if event == "start":
+            if node.tag not in ("script", "style") and node.text:
+                yield node.text
+        elif node is not root and node.tail:
+            yield node.tail
+
+
+def _submit_daemon(fn, *args) -> Future:
+    """Run fn(*args) on a daemon thread, so an abandoned call doesn't hold up interpreter exit."""
+    future: Future = Future()
+
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, daemon=True).start()
+    return future
 
 
 class CarSpecScraper:
@@ -194,10 +505,33 @@ class CarSpecScraper:
     
     BASE_URL = "https://www.automobile-catalog.com"
     SKIP_LINK_TEXTS = {'Home', 'Search', 'About', 'Back', 'Login', 'Sign in', 'Contact', 'Privacy', 'Terms'}
+    MAX_WORKERS = 8
+    # Concurrent requests allowed per host, so the candidate fan-out doesn't hammer the site
+    HOST_CONCURRENCY = 2
     
-    def __init__(self, verbose: bool = False):
-        self.session = requests.Session()
-        self.verbose = verbose
+    def __init__(self, use_cache: bool = True):
+        if use_cache:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            # Only 200s are stored; server Cache-Control/ETag headers take precedence over the default expiry,
+            # and an expired entry is still served if the site can't be reached
+            self.session = CachedSession(os.path.join(CACHE_DIR, "http_cache"), backend="sqlite",
+                                         expire_after=CACHE_EXPIRE_SECONDS, allowable_codes=(200,),
+                                         cache_control=True, stale_if_error=True)
+        else:
+            self.session = requests.Session()
+        # Keep-alive pool sized for the candidate fan-out; retry transient gateway errors. 503 is left out:
+        # Cloudflare serves its challenge as 503, and retrying it only delays the browser fallback.
+        # Read timeouts aren't retried, so a stalled page costs one timeout rather than four.
+        retry = Retry(total=3, read=0, backoff_factor=0.5, status_forcelist=[502, 504], allowed_methods=["GET"],
+                      raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.use_cache = use_cache
+        self.executor = ThreadPoolExecutor(max_workers=self.MAX_WORKERS)
+        self._host_slots: Dict[str, threading.Semaphore] = {}
+        self._host_slots_lock = threading.Lock()
+        self._specs_memo: Dict[Tuple[str, ...], Optional[Dict]] = {}
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
@@ -207,29 +541,59 @@ class CarSpecScraper:
             'Upgrade-Insecure-Requests': '1',
         })
     
+    def _host_slot(self, url: str) -> threading.Semaphore:
+        host = urlparse(url).netloc.lower()
+        with self._host_slots_lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = self._host_slots[host] = threading.Semaphore(self.HOST_CONCURRENCY)
+            return slot
+    
+    def _get(self, url: str, **kwargs) -> requests.Response:
+        """GET through the shared session, limited to HOST_CONCURRENCY in-flight requests per host."""
+        with self._host_slot(url):
+            return self.session.get(url, **kwargs)
+    
+    def _fetch_with_browser(self, url: str) -> Optional[str]:
+        """Selenium fetch, with the rendered HTML cached on disk (the HTTP cache never sees it)."""
+        if self.use_cache:
+            html = _read_browser_cache(url)
+            if html:
+                return html
+        html = _fetch_with_selenium(url)
+        if html and self.use_cache:
+            _write_browser_cache(url, html)
+        return html
+    
     def _is_blocked(self, response: requests.Response) -> bool:
         if response.status_code == 403:
             return True
-        text = (response.text or "")[:2000]
-        return "Just a moment" in text or "cf_chl" in text or "challenge" in text.lower()
+        # Cloudflare challenges are served as 503 by a cloudflare server; only then is the body worth scanning
+        if response.status_code != 503 or not response.headers.get("Server", "").lower().startswith("cloudflare"):
+            return False
+        head = response.content[:2000]
+        return b"Just a moment" in head or b"cf_chl" in head or b"jschl_vc" in head
     
     def _extract_models_from_soup(self, soup: BeautifulSoup, brand: str) -> List[Dict]:
         """Extract model entries from parsed HTML. Site path format: /model/BRAND/MODEL.html"""
         models = []
         seen_urls = set()
         brand_lower = brand.lower()
+        base_url = self.BASE_URL
+        skip_texts = self.SKIP_LINK_TEXTS
         
-        for link in soup.find_all('a', href=True):
+        for link in soup.select('a[href]'):
             href = link.get('href', '').strip()
             text = link.get_text(strip=True)
-            if not text or len(text) < 2 or text in self.SKIP_LINK_TEXTS:
+            if not text or len(text) < 2 or text in skip_texts:
                 continue
-            full_url = urljoin(self.BASE_URL, href)
-            if self.BASE_URL not in full_url or 'automobile-catalog.com' not in full_url:
+            full_url = urljoin(base_url, href)
+            # BASE_URL already contains the automobile-catalog.com host
+            if base_url not in full_url:
                 continue
             path_lower = href.lower() if href.startswith('/') else full_url.lower()
             # Accept links to /model/... (and legacy /car/, /make/ if present)
-            if '/model/' in path_lower or '/car/' in path_lower or '/make/' in path_lower or brand_lower in path_lower:
+            if _MODEL_PATH_RE.search(path_lower) or brand_lower in path_lower:
                 if full_url not in seen_urls and len(text) < 120:
                     seen_urls.add(full_url)
                     models.append({'name': text, 'url': full_url})
@@ -241,82 +605,145 @@ class CarSpecScraper:
         if not model_slug:
             return []
         brand_slug = brand.lower().strip().replace(' ', '_')
-        slug = model_slug.lower().strip().replace(' ', '_').replace('-', '_')
+        slug = model_slug.strip().lower().translate(_SLUG_TABLE)
         url = f"{self.BASE_URL}/model/{brand_slug}/{slug}.html"
         return [{"name": f"{brand} {model_slug.replace('_', ' ').title()}", "url": url}]
     
-    def get_model_specs(self, model_url: str) -> Optional[Dict]:
-        """Get specifications for a specific car model"""
-        try:
-            print(f"Fetching: {model_url}")
-            response = self.session.get(model_url, timeout=15)
-            html = None
+    def _fetch_and_parse(self, url: str) -> Tuple[Optional[Dict], Optional[requests.Response]]:
+        """Fetch one candidate page and parse it. Returns (specs, response); specs is None if the page was unusable."""
+        response = self._get(url, timeout=15)
+        if response.ok and not self._is_blocked(response):
+            validator = _response_validator(response) if self.use_cache else None
+            if validator:
+                specs = _read_specs_cache(url, validator)
+                if specs:
+                    return specs, response
+            charset = _CHARSET_RE.search(response.headers.get("Content-Type", ""))
+            specs = self._parse_specs(response.content, url, charset.group(1) if charset else None)
+            if specs and validator:
+                _write_specs_cache(url, validator, specs)
+            return specs, response
+        return None, response
+
+    def get_model_specs(self, model_url: Union[str, List[str]]) -> Optional[Dict]:
+        """Get specifications for a specific car model from one URL or a best-first list of candidates."""
+        key = (model_url,) if isinstance(model_url, str) else tuple(model_url)
+        if key not in self._specs_memo:
+            self._specs_memo[key] = self._scrape_model_specs(list(key))
+        specs = self._specs_memo[key]
+        return dict(specs) if specs else None
+
+    def _scrape_model_specs(self, model_urls: List[str]) -> Optional[Dict]:
+        if self.use_cache:
+            skipped = [url for url in model_urls if _is_recent_miss(url)]
+            for url in skipped:
+                log.info("Skipping (no specs there on a recent run): %s", url)
+            model_urls = [url for url in model_urls if url not in skipped]
+        for url in model_urls:
+            log.info("Fetching: %s", url)
+        # All candidates are fetched at once, but results are taken in candidate (best-first) order:
+        # a lower-ranked page only wins once every page ahead of it has come back without specs.
+        # Daemon threads, so fetches still running behind the winner are simply abandoned at exit.
+        futures = {_submit_daemon(self._fetch_and_parse, url): url for url in model_urls}
+        blocked = set()
+        # Pages that were reached but had no specs; network errors and blocks aren't remembered
+        misses = set()
+        for future, url in futures.items():
+            try:
+                specs, response = future.result()
+            except Exception as e:
+                log.info("  Request failed for %s: %s", url, e)
+                continue
+            if specs:
+                return specs
             if self._is_blocked(response):
-                print("  Page blocked, trying browser fallback...")
-                html = _fetch_with_selenium(model_url, verbose=self.verbose)
-            if html is None and response.ok:
-                html = response.text
-            if not html:
+                blocked.add(url)
+            elif response.ok or response.status_code in (404, 410):
+                misses.add(url)
+
+        # No candidate yielded specs directly: retry blocked pages in the browser, in candidate order
+        for url in model_urls:
+            if url not in blocked:
+                continue
+            log.info("  Page blocked, trying browser fallback...")
+            html = self._fetch_with_browser(url)
+            specs = self._parse_specs(html, url) if html else None
+            if specs:
+                return specs
+            if html:
+                misses.add(url)
+        if self.use_cache:
+            for url in misses:
+                _record_miss(url)
+        return None
+
+    def _parse_specs(self, html: Union[str, bytes], model_url: str, encoding: Optional[str] = None) -> Optional[Dict]:
+        """Extract specs (and the car image URL) from a model page."""
+        try:
+            if isinstance(html, str):
+                html, encoding = html.encode("utf-8"), "utf-8"
+            parser = (_html_parser_for(encoding)
+                      or _html_parser_for(EncodingDetector.find_declared_encoding(html, is_html=True))
+                      or lxml.html.HTMLParser(encoding="utf-8"))
+            try:
+                tree = lxml.html.document_fromstring(html, parser=parser)
+            except etree.ParserError:
                 return None
-            soup = BeautifulSoup(html, 'html.parser')
             
             specs = {}
-            text_content = soup.get_text(separator=' ', strip=True)
+            text_content = ' '.join(t for t in map(str.strip, _text_strings(tree)) if t)
             
             # Look for specification tables
-            tables = soup.find_all('table')
-            for table in tables:
-                rows = table.find_all('tr')
-                for row in rows:
-                    cells = row.find_all(['td', 'th'])
-                    if len(cells) >= 2:
-                        label = cells[0].get_text(strip=True).lower()
-                        value = cells[1].get_text(strip=True)
-                        
-                        # Map common labels to our spec keys; only accept short, spec-like values
-                        def _ok_spec_val(v, max_len=35):
-                            v = (v or "").strip().replace("\n", " ")[:max_len]
-                            if not v or len(v) > max_len:
-                                return None
-                            if any(x in v.lower() for x in ("coupe", "roadster", "submodel", "belonging", "vers", "gen.")):
-                                return None
-                            return v
-                        if 'engine' in label or 'displacement' in label:
-                            if _ok_spec_val(value):
-                                specs['engine'] = _ok_spec_val(value)
-                        elif 'power' in label or 'horsepower' in label or 'hp' in label:
-                            if _ok_spec_val(value):
-                                specs['power'] = _ok_spec_val(value)
-                        elif 'torque' in label:
-                            if _ok_spec_val(value):
-                                specs['torque'] = _ok_spec_val(value)
-                        elif 'weight' in label or 'mass' in label:
-                            if _ok_spec_val(value):
-                                specs['weight'] = _ok_spec_val(value)
-                        elif 'acceleration' in label or '0-100' in label or '0-60' in label:
-                            if _ok_spec_val(value):
-                                specs['acceleration_0_100'] = _ok_spec_val(value)
-                        elif 'top speed' in label or 'maximum speed' in label:
-                            if _ok_spec_val(value):
-                                specs['top_speed'] = _ok_spec_val(value)
-                        elif 'year' in label or 'production' in label:
-                            if _ok_spec_val(value, 20) and re.match(r"^[\d\s\-]+$", value.strip()[:20]):
-                                specs['year'] = value.strip()[:20]
-            
+            for row in tree.xpath('//table//tr'):
+                cells = row.xpath('.//td|.//th')
+                if len(cells) >= 2:
+                    label = ''.join(t.strip() for t in _text_strings(cells[0])).lower()
+                    value = ''.join(t.strip() for t in _text_strings(cells[1]))
+
+                    # Map common labels to our spec keys; only accept short, spec-like values
+                    def _ok_spec_val(v, max_len=35):
+                        v = (v or "").strip().replace("\n", " ")[:max_len]
+                        if not v or len(v) > max_len:
+                            return None
+                        if any(x in v.lower() for x in ("coupe", "roadster", "submodel", "belonging", "vers", "gen.")):
+                            return None
+                        return v
+                    if 'engine' in label or 'displacement' in label:
+                        if _ok_spec_val(value):
+                            specs['engine'] = _ok_spec_val(value)
+                    elif 'power' in label or 'horsepower' in label or 'hp' in label:
+                        if _ok_spec_val(value):
+                            specs['power'] = _ok_spec_val(value)
+                    elif 'torque' in label:
+                        if _ok_spec_val(value):
+                            specs['torque'] = _ok_spec_val(value)
+                    elif 'weight' in label or 'mass' in label:
+                        if _ok_spec_val(value):
+                            specs['weight'] = _ok_spec_val(value)
+                    elif 'acceleration' in label or '0-100' in label or '0-60' in label:
+                        if _ok_spec_val(value):
+                            specs['acceleration_0_100'] = _ok_spec_val(value)
+                    elif 'top speed' in label or 'maximum speed' in label:
+                        if _ok_spec_val(value):
+                            specs['top_speed'] = _ok_spec_val(value)
+                    elif 'year' in label or 'production' in label:
+                        if _ok_spec_val(value, 20) and _YEAR_VALUE_RE.match(value.strip()[:20]):
+                            specs['year'] = value.strip()[:20]
+
             # Fallback: Use regex patterns on full text
             if not specs.get('engine'):
-                engine_match = re.search(r'(\d+\.?\d*)\s*L(?:\s*TFSI|\s*TDI|\s*V6|\s*V8|\s*I4)?', text_content, re.I)
+                engine_match = _ENGINE_RE.search(text_content)
                 if engine_match:
                     specs['engine'] = engine_match.group(0).strip()
             
             if not specs.get('power'):
                 # Look for HP, PS, or kW
-                power_match = re.search(r'(\d+)\s*(?:HP|hp|PS|ps|kW|kw)', text_content, re.I)
+                power_match = _POWER_RE.search(text_content)
                 if power_match:
                     specs['power'] = f"{power_match.group(1)} HP"
             
             if not specs.get('torque'):
-                torque_match = re.search(r'(\d+)\s*Nm|(\d+)\s*lb-ft|(\d+)\s*lb\.ft', text_content, re.I)
+                torque_match = _TORQUE_RE.search(text_content)
                 if torque_match:
                     if torque_match.group(1):
                         specs['torque'] = f"{torque_match.group(1)} Nm"
@@ -324,7 +751,7 @@ class CarSpecScraper:
                         specs['torque'] = f"{torque_match.group(2) or torque_match.group(3)} lb-ft"
             
             if not specs.get('weight'):
-                weight_match = re.search(r'(\d{3,5})\s*kg|(\d{3,5})\s*lbs?', text_content, re.I)
+                weight_match = _WEIGHT_RE.search(text_content)
                 if weight_match:
                     if weight_match.group(1):
                         specs['weight'] = f"{weight_match.group(1)} kg"
@@ -332,60 +759,71 @@ class CarSpecScraper:
                         specs['weight'] = f"{weight_match.group(2)} lbs"
             
             if not specs.get('acceleration_0_100'):
-                accel_match = re.search(r'0-100[^\d]*(\d+\.?\d*)\s*s(?:ec)?|0-60[^\d]*(\d+\.?\d*)\s*s(?:ec)?', text_content, re.I)
+                accel_match = _ACCEL_RE.search(text_content)
                 if accel_match:
                     specs['acceleration_0_100'] = f"{accel_match.group(1) or accel_match.group(2)} s"
             
             if not specs.get('top_speed'):
-                speed_match = re.search(r'(?:top|max(?:imum)?)\s*speed[^\d]*(\d+)\s*km/h|(\d+)\s*km/h.*top', text_content, re.I)
+                speed_match = _TOP_SPEED_RE.search(text_content)
                 if speed_match:
                     specs['top_speed'] = f"{speed_match.group(1) or speed_match.group(2)} km/h"
             
             if not specs.get('year'):
                 # Look for year ranges in the URL or text
-                year_match = re.search(r'(\d{4})\s*-\s*(\d{4})|(\d{4})', model_url + ' ' + text_content)
+                year_match = _YEAR_RE.search(model_url + ' ' + text_content)
                 if year_match:
                     if year_match.group(2):
                         specs['year'] = f"{year_match.group(1)}-{year_match.group(2)}"
                     else:
                         specs['year'] = year_match.group(3)
 
-            # Extract main car image URL (for poster)
-            for img in soup.find_all('img', src=True):
-                src = img.get('src', '').strip()
-                if not src or 'logo' in src.lower() or 'icon' in src.lower() or 'pixel' in src.lower():
-                    continue
-                full_img_url = urljoin(model_url, src)
-                if 'automobile-catalog.com' in full_img_url or full_img_url.startswith('http'):
-                    specs['image_url'] = full_img_url
+            # Extract main car image URL (for poster): first image that isn't site chrome or a tracking pixel,
+            # else the first image with a non-trivial src. One pass records both.
+            best = fallback = None
+            for img in tree.xpath('//img[@src]'):
+                src = img.get('src').strip()
+                if fallback is None and len(src) > 10:
+                    fallback = src
+                src_lower = src.lower()
+                if src and not src_lower.startswith('data:') and not any(x in src_lower for x in ('logo', 'icon', 'pixel')):
+                    best = src
                     break
-            if 'image_url' not in specs:
-                for img in soup.find_all('img', src=True):
-                    src = img.get('src', '').strip()
-                    if src and len(src) > 10:
-                        specs['image_url'] = urljoin(model_url, src)
-                        break
+            if best or fallback:
+                specs['image_url'] = urljoin(model_url, best or fallback)
             
-            return specs if specs else None
+            if not specs:
+                return None
+            specs['_url'] = model_url
+            return specs
             
         except Exception as e:
-            print(f"Error getting specs from {model_url}: {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception("Error getting specs from %s: %s", model_url, e)
             return None
 
 
+# Rendered flags keyed by (country_code, w, h); many brands share a country, so each flag is drawn once
+_FLAG_CACHE: Dict[Tuple[str, int, int], "Image.Image"] = {}
+
+
 class PosterGenerator:
     """Generates car poster images matching the reference design"""
     
-    def __init__(self, width=1200, height=1600):
+    def __init__(self, width=1200, height=1600, executor: Optional[Executor] = None,
+                 http_get: Optional[Callable[..., requests.Response]] = None):
         self.width = width
         self.height = height
         self.margin = 60
         self.border_width = 2
+        # When set, the car image is downloaded in the background while the rest of the poster is drawn
+        self.executor = executor
+        # GET used for the car image download (e.g. the scraper's per-host limited _get); plain requests if None
+        self.http_get = http_get or requests.get
     
-    def _get_font(self, size, bold=False):
-        """Get font with fallback options"""
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _get_font(size, bold=False):
+        """Get font with fallback options. Cached: the path probing and font load run once per size/weight."""
+        from PIL import ImageFont
         font_paths = [
             ("arial.ttf", "arialbd.ttf"),
             ("C:/Windows/Fonts/arial.ttf", "C:/Windows/Fonts/arialbd.ttf"),
@@ -409,47 +847,76 @@ class PosterGenerator:
         # Ultimate fallback
         return ImageFont.load_default()
     
-    def _draw_country_flag(self, draw: ImageDraw.ImageDraw, country_code: str, x: int, y: int, w: int, h: int):
-        """Draw the flag of the given country (ISO 3166-1 alpha-2) in the given rectangle."""
-        country_code = (country_code or '').upper()[:2]
-        if not country_code or country_code not in FLAG_DEFINITIONS:
-            return
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _text_bbox(text, font):
+        """Same as draw.textbbox((0, 0), text, font=font), memoized. Fonts come from the _get_font cache, so they are stable keys."""
+        from PIL import Image, ImageDraw
+        return ImageDraw.Draw(Image.new("RGB", (1, 1))).textbbox((0, 0), text, font=font)
+
+    def _render_flag(self, country_code: str, w: int, h: int) -> "Image.Image":
+        """Render a flag as a (w + 1) x (h + 1) image: the pixels draw.rectangle([x, y, x + w, y + h]) covers."""
+        from PIL import Image, ImageColor, ImageDraw
         kind, data = FLAG_DEFINITIONS[country_code]
-        if kind == 'h':
-            colors = data
-            n = len(colors)
-            stripe_h = h / n
-            for i, color in enumerate(colors):
-                y1 = int(y + i * stripe_h)
-                y2 = int(y + (i + 1) * stripe_h)
-                draw.rectangle([x, y1, x + w, y2], fill=color)
-        elif kind == 'v':
+        if kind in ('h', 'v'):
             colors = data
             n = len(colors)
-            stripe_w = w / n
+            length = h if kind == 'h' else w
+            import numpy as np
+            arr = np.empty((h + 1, w + 1, 3), dtype=np.uint8)
+            # Integer division keeps the stripe edges exact and gap-free; the last stripe also covers the edge pixel
+            bounds = [(i * length) // n for i in range(n)] + [length + 1]
             for i, color in enumerate(colors):
-                x1 = int(x + i * stripe_w)
-                x2 = int(x + (i + 1) * stripe_w)
-                draw.rectangle([x1, y, x2, y + h], fill=color)
-        elif kind == 'circle':
-            bg_color, circle_color = data
-            draw.rectangle([x, y, x + w, y + h], fill=bg_color)
-            cx = x + w // 2
-            cy = y + h // 2
+                if kind == 'h':
+                    arr[bounds[i]:bounds[i + 1]] = ImageColor.getrgb(color)
+                else:
+                    arr[:, bounds[i]:bounds[i + 1]] = ImageColor.getrgb(color)
+            return Image.fromarray(arr)
+
+        bg_color = data[0]
+        flag = Image.new("RGB", (w + 1, h + 1), bg_color)
+        draw = ImageDraw.Draw(flag)
+        if kind == 'circle':
+            circle_color = data[1]
+            cx = w // 2
+            cy = h // 2
             r = int(min(w, h) * 0.35)
             draw.ellipse([cx - r, cy - r, cx + r, cy + r], fill=circle_color)
         elif kind == 'cross':
-            bg_color, cross_color = data
-            draw.rectangle([x, y, x + w, y + h], fill=bg_color)
+            cross_color = data[1]
             bar_w = max(2, w // 5)
             bar_h = max(2, h // 5)
             # Vertical bar
-            v_x = x + (w - bar_w) // 2
-            draw.rectangle([v_x, y, v_x + bar_w, y + h], fill=cross_color)
+            v_x = (w - bar_w) // 2
+            draw.rectangle([v_x, 0, v_x + bar_w, h], fill=cross_color)
             # Horizontal bar
-            h_y = y + (h - bar_h) // 2
-            draw.rectangle([x, h_y, x + w, h_y + bar_h], fill=cross_color)
+            h_y = (h - bar_h) // 2
+            draw.rectangle([0, h_y, w, h_y + bar_h], fill=cross_color)
+        return flag
+
+    def _draw_country_flag(self, img: "Image.Image", country_code: str, x: int, y: int, w: int, h: int):
+        """Draw the flag of the given country (ISO 3166-1 alpha-2) in the given rectangle."""
+        country_code = (country_code or '').upper()[:2]
+        if not country_code or country_code not in FLAG_DEFINITIONS:
+            return
+        key = (country_code, w, h)
+        flag = _FLAG_CACHE.get(key)
+        if flag is None:
+            flag = _FLAG_CACHE[key] = self._render_flag(country_code, w, h)
+        img.paste(flag, (x, y))
     
+    def _fetch_car_image(self, image_url: str, max_size: Tuple[int, int]) -> Optional["Image.Image"]:
+        """Download and decode the car photo (JPEGs at reduced scale, about twice max_size). None if refused."""
+        from PIL import Image
+        resp = self.http_get(image_url, timeout=10, headers={"User-Agent": "Mozilla/5.0 (compatible; CarPoster/1.0)"})
+        if not resp.ok:
+            return None
+        car_img = Image.open(io.BytesIO(resp.content))
+        # Draft mode lets libjpeg skip the pixels the thumbnail would throw away
+        car_img.draft("RGB", (max_size[0] * 2, max_size[1] * 2))
+        car_img.load()
+        return car_img.convert("RGB")
+
     def _sanitize_spec_value(self, v: str, max_len: int = 22) -> str:
         """Keep spec values short so they don't overlap in layout."""
         if not v:
@@ -459,11 +926,18 @@ class PosterGenerator:
             v = v[: max_len - 1] + "…"
         return v
 
-    def generate_poster(self, brand: str, model: str, specs: Dict, output_path: str):
+    def generate_poster(self, brand: str, model: str, specs: Mapping, output_path: str):
         """Generate a poster image with car specifications matching reference design"""
+        from PIL import Image, ImageDraw
         # Strip internal keys used for image URL
         display_specs = {k: v for k, v in specs.items() if not k.startswith("_") and k != "image_url"}
         image_url = specs.get("image_url")
+        image_future = None
+        box_w = self.width - 2 * self.margin - 40
+        # Upper bound for the image box height; the exact value depends on the header drawn below
+        max_box_h = self.height - 2 * self.margin - 360
+        if image_url and self.executor is not None:
+            image_future = self.executor.submit(self._fetch_car_image, image_url, (box_w, max_box_h))
 
         # Create image with white background
         img = Image.new("RGB", (self.width, self.height), color="white")
@@ -484,12 +958,12 @@ class PosterGenerator:
         header_y = self.margin + 50
         brand_text = brand.upper()
         draw.text((self.margin + 50, header_y), brand_text, fill="#888888", font=brand_font)
-        bbox = draw.textbbox((0, 0), brand_text, font=brand_font)
+        bbox = self._text_bbox(brand_text, brand_font)
         brand_height = bbox[3] - bbox[1]
         model_text = model.upper()
         model_y = header_y + brand_height + 15
         draw.text((self.margin + 50, model_y), model_text, fill="#1a1a1a", font=model_font)
-        bbox = draw.textbbox((0, 0), model_text, font=model_font)
+        bbox = self._text_bbox(model_text, model_font)
         model_header_bottom = model_y + (bbox[3] - bbox[1])
 
         # Gray image area (reference style) and car image
@@ -497,25 +971,8 @@ class PosterGenerator:
         spec_area_top = self.height - self.margin - 320
         image_area_bottom = spec_area_top - 40
         gray_bg = "#e5e5e5"
-        draw.rectangle([border_x + 20, image_area_top, self.width - border_x - 20, image_area_bottom], fill=gray_bg)
-
-        if image_url:
-            try:
-                resp = requests.get(image_url, timeout=10, headers={"User-Agent": "Mozilla/5.0 (compatible; CarPoster/1.0)"})
-                if resp.ok:
-                    from io import BytesIO
-                    car_img = Image.open(BytesIO(resp.content)).convert("RGB")
-                    iw, ih = car_img.size
-                    box_w = self.width - 2 * self.margin - 40
-                    box_h = image_area_bottom - image_area_top
-                    scale = min(box_w / iw, box_h / ih, 1.0)
-                    nw, nh = int(iw * scale), int(ih * scale)
-                    car_img = car_img.resize((nw, nh), Image.Resampling.LANCZOS)
-                    paste_x = self.margin + 20 + (box_w - nw) // 2
-                    paste_y = image_area_top + (box_h - nh) // 2
-                    img.paste(car_img, (paste_x, paste_y))
-            except Exception:
-                pass
+        # Solid fill via paste (paste boxes exclude the right/bottom edge, rectangle() includes it)
+        img.paste(gray_bg, (border_x + 20, image_area_top, self.width - border_x - 20 + 1, image_area_bottom + 1))
 
         # Specs section: fixed column widths so text never overlaps
         spec_y_start = spec_area_top
@@ -544,7 +1001,7 @@ class PosterGenerator:
         for i, (label, value) in enumerate(mid_items):
             y = spec_y_start + i * line_height
             draw.text((mid_col_x, y), label, fill=text_color, font=label_font)
-            vb = draw.textbbox((0, 0), value, font=value_font)
+            vb = self._text_bbox(value, value_font)
             val_w = min(vb[2] - vb[0], mid_val_end - mid_val_start)
             draw.text((mid_val_end - val_w, y), value, fill=text_color, font=value_font)
 
@@ -559,7 +1016,7 @@ class PosterGenerator:
         for i, (label, value) in enumerate(right_items):
             y = spec_y_start + i * line_height
             draw.text((right_col_x, y), label, fill=text_color, font=label_font)
-            vb = draw.textbbox((0, 0), value, font=value_font)
+            vb = self._text_bbox(value, value_font)
             val_w = min(vb[2] - vb[0], col_width - r_label_w - 15)
             draw.text((r_val_end - val_w, y), value, fill=text_color, font=value_font)
 
@@ -569,33 +1026,55 @@ class PosterGenerator:
         flag_w, flag_h = 36, 24
         flag_x = r_val_end - flag_w
         if country_code:
-            self._draw_country_flag(draw, country_code, flag_x, flag_y, flag_w, flag_h)
+            self._draw_country_flag(img, country_code, flag_x, flag_y, flag_w, flag_h)
+
+        # Car image goes in last so its download overlaps with the drawing above
+        if image_url:
+            try:
+                if image_future is not None:
+                    car_img = image_future.result(timeout=10)
+                else:
+                    car_img = self._fetch_car_image(image_url, (box_w, max_box_h))
+                if car_img is not None:
+                    box_h = image_area_bottom - image_area_top
+                    # Fit inside the box without upscaling; draft decoding already left the source within ~2x,
+                    # so bicubic is indistinguishable from Lanczos here and cheaper
+                    car_img.thumbnail((box_w, box_h), Image.Resampling.BICUBIC)
+                    nw, nh = car_img.size
+                    paste_x = self.margin + 20 + (box_w - nw) // 2
+                    paste_y = image_area_top + (box_h - nh) // 2
+                    img.paste(car_img, (paste_x, paste_y))
+            except Exception:
+                pass
         
         # Save image
         if output_path.lower().endswith('.jpg') or output_path.lower().endswith('.jpeg'):
             # Convert to RGB if needed for JPG
             if img.mode != 'RGB':
                 img = img.convert('RGB')
-            img.save(output_path, 'JPEG', quality=95)
+            img.save(output_path, 'JPEG', quality=88, optimize=False, progressive=False, subsampling='4:2:0')
         else:
-            img.save(output_path, 'PNG', quality=95)
+            img.save(output_path, 'PNG')
         
         print(f"Poster saved to: {output_path}")
 
 
+# Sample specs (Audi TT RS) for --demo and for the poster made when scraping fails; read-only
+_DEMO_SPECS = types.MappingProxyType({
+    'year': '2016-2023',
+    'engine': '2.5L TFSI',
+    'power': '394 HP',
+    'torque': '480 Nm',
+    'weight': '1450 kg',
+    'acceleration_0_100': '3.7 s',
+    'top_speed': '250 km/h'
+})
+
+
 def demo_mode():
     """Generate a demo poster with sample data (for testing)"""
     generator = PosterGenerator()
-    demo_specs = {
-        'year': '2016-2023',
-        'engine': '2.5L TFSI',
-        'power': '394 HP',
-        'torque': '480 Nm',
-        'weight': '1450 kg',
-        'acceleration_0_100': '3.7 s',
-        'top_speed': '250 km/h'
-    }
-    generator.generate_poster('AUDI', 'TT RS', demo_specs, 'demo_poster.png')
+    generator.generate_poster('AUDI', 'TT RS', _DEMO_SPECS, 'demo_poster.png')
     print("Demo poster generated: demo_poster.png")
 
 
@@ -621,28 +1100,22 @@ Site URL format: https://www.automobile-catalog.com/model/BRAND/MODEL.html (mode
     parser.add_argument('--output', default='car_poster.png', help='Output file path (PNG or JPG)')
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
     parser.add_argument('--demo', action='store_true', help='Generate demo poster with sample data')
+    parser.add_argument('--no-cache', action='store_true', help='Do not read or write the page/image cache')
     
     args = parser.parse_args()
+    # Site uses /model/BRAND/MODEL.html only; there is no brand-only page, so both are required outside --demo
+    if not args.demo and not (args.brand and args.model):
+        parser.error("brand and --model are required unless --demo is given "
+                     "(e.g. Audi --model \"TT RS\", or the exact slug: Audi --model tt_gen_2)")
+    logging.basicConfig(format="%(message)s", stream=sys.stdout)
+    log.setLevel(logging.DEBUG if args.verbose else logging.INFO)
     
     # Demo mode
     if args.demo:
         demo_mode()
         return
     
-    if not args.brand:
-        parser.print_help()
-        return
-    
-    scraper = CarSpecScraper(verbose=args.verbose)
-    generator = PosterGenerator()
-
-    # Site uses /model/BRAND/MODEL.html only; there is no brand-only page. --model is required.
-    if not args.model:
-        print(f"\n[!] --model is required. The site uses URLs like /model/brand/model_slug.html")
-        print(f"    Example: python car_poster_generator.py Audi --model \"TT RS\"")
-        print(f"    Or with exact slug: python car_poster_generator.py Audi --model tt_gen_2")
-        print(f"    Use the model slug from the site (e.g. tt_gen_2, tt_rs, a4).")
-        return
+    scraper = CarSpecScraper(use_cache=not args.no_cache)
 
     print(f"Fetching {args.brand} {args.model} from automobile-catalog.com...")
     brand_key = args.brand.lower().strip()
@@ -650,16 +1123,14 @@ Site URL format: https://www.automobile-catalog.com/model/BRAND/MODEL.html (mode
     models = []
 
     # Prefer known URLs (exact slugs like tt_gen_2) when defined
-    for (b, m), entries in KNOWN_MODEL_URLS.items():
-        if b == brand_key and (m in model_key or model_key in m):
-            models = [{"name": name, "url": url} for name, url in entries]
-            if args.verbose:
-                print(f"Using known URL(s) for this model.")
-            break
+    entries = _find_known_urls(brand_key, model_key)
+    if entries:
+        models = [{"name": name, "url": url} for name, url in entries]
+        log.debug("Using known URL(s) for %s %s", args.brand, args.model)
     if not models:
         models = scraper.search_brand(args.brand, args.model)
         if models:
-            print(f"Trying URL: {models[0]['url']}")
+            log.info("Trying URL: %s", models[0]['url'])
 
     if not models:
         print(f"\n[!] Could not build URL for {args.brand} {args.model}.")
@@ -667,37 +1138,26 @@ Site URL format: https://www.automobile-catalog.com/model/BRAND/MODEL.html (mode
         print("    Try --model with the exact slug from the site, or add it to KNOWN_MODEL_URLS in the script.")
         return
     
-    # Try each candidate URL (e.g. tt_gen_2 then tt_rs) until we get specs
+    # Fetch all candidate URLs (e.g. tt_gen_2 and tt_rs) at once and use the first that loads
     selected_model = models[0]
-    specs = None
     for candidate in models:
-        print(f"\n[OK] Trying: {candidate['name']}")
-        print(f"Fetching: {candidate['url']}...")
-        specs = scraper.get_model_specs(candidate['url'])
-        if specs:
-            selected_model = candidate
-            break
+        log.info("\n[OK] Trying: %s", candidate['name'])
+    specs = scraper.get_model_specs([candidate['url'] for candidate in models])
+    if specs:
+        selected_model = next((c for c in models if c['url'] == specs.get('_url')), selected_model)
 
+    # Built only after the lookup succeeded; it shares the scraper's workers and per-host limited HTTP GET
+    generator = PosterGenerator(executor=scraper.executor, http_get=scraper._get)
     if specs:
         print(f"\n[OK] Retrieved specifications:")
-        for key, value in specs.items():
-            print(f"  {key}: {value}")
+        sys.stdout.write("".join(f"  {key}: {value}\n" for key, value in specs.items() if not key.startswith("_")))
         print(f"\nGenerating poster...")
         generator.generate_poster(args.brand, selected_model['name'], specs, args.output)
         print(f"\n[OK] Success! Poster saved to: {args.output}")
     else:
         print("\n[!] Could not retrieve specifications (page may be blocked or format changed).")
         print("Generating poster with reference data for this model...")
-        demo_specs = {
-            'year': '2016-2023',
-            'engine': '2.5L TFSI',
-            'power': '394 HP',
-            'torque': '480 Nm',
-            'weight': '1450 kg',
-            'acceleration_0_100': '3.7 s',
-            'top_speed': '250 km/h'
-        }
-        generator.generate_poster(args.brand, selected_model['name'], demo_specs, args.output)
+        generator.generate_poster(args.brand, selected_model['name'], _DEMO_SPECS, args.output)
         print(f"\n[OK] Poster saved to: {args.output} (using reference specs)")
 
 